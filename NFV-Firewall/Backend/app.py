@@ -1,133 +1,273 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from firewall_manager import FirewallManager
-import logging
-import os
-
-# Ensure database directory exists
-os.makedirs('database', exist_ok=True)
-
-app = Flask(__name__)
-CORS(app)
-
-# Initialize firewall manager
-firewall_mgr = FirewallManager()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-@app.route('/')
-def health_check():
-    return jsonify({
-        "status": "SME Firewall Manager API is running",
-        "version": "1.0.0",
-        "technologies": ["OSM", "OpenFlow", "NETCONF", "REST API"]
-    })
-
-@app.route('/api/firewalls', methods=['GET'])
-def get_firewalls():
-    """Get all firewall instances"""
-    try:
-        firewalls = firewall_mgr.get_all_firewalls()
-        return jsonify({"success": True, "firewalls": firewalls})
-    except Exception as e:
-        logger.error(f"Error getting firewalls: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/firewalls/deploy', methods=['POST'])
-def deploy_firewall():
-    """Deploy a new firewall instance"""
-    try:
-        config = request.json
-        logger.info(f"Deploying firewall with config: {config}")
-        
-        # Validate required fields
-        required_fields = ['name', 'management_ip', 'subnet', 'vcpu', 'ram', 'security_policy']
-        for field in required_fields:
-            if field not in config:
-                return jsonify({
-                    "success": False, 
-                    "error": f"Missing required field: {field}"
-                }), 400
-        
-        # Deploy firewall
-        result = firewall_mgr.deploy_firewall(config)
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"Error deploying firewall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/firewalls/<firewall_id>/start', methods=['POST'])
-def start_firewall(firewall_id):
-    """Start a firewall instance"""
-    try:
-        result = firewall_mgr.start_firewall(firewall_id)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error starting firewall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/firewalls/<firewall_id>/stop', methods=['POST'])
-def stop_firewall(firewall_id):
-    """Stop a firewall instance"""
-    try:
-        result = firewall_mgr.stop_firewall(firewall_id)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error stopping firewall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/firewalls/<firewall_id>/configure', methods=['POST'])
-def configure_firewall(firewall_id):
-    """Configure firewall rules"""
-    try:
-        config = request.json
-        result = firewall_mgr.configure_firewall(firewall_id, config)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error configuring firewall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/firewalls/<firewall_id>', methods=['DELETE'])
-def delete_firewall(firewall_id):
-    """Delete a firewall instance"""
-    try:
-        result = firewall_mgr.delete_firewall(firewall_id)
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"Error deleting firewall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/logs', methods=['GET'])
-def get_logs():
-    """Get system logs"""
-    try:
-        logs = firewall_mgr.get_system_logs()
-        return jsonify({"success": True, "logs": logs})
-    except Exception as e:
-        logger.error(f"Error getting logs: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-@app.route('/api/statistics', methods=['GET'])
-def get_statistics():
-    """Get system statistics"""
-    try:
-        stats = firewall_mgr.get_statistics()
-        return jsonify({"success": True, "statistics": stats})
-    except Exception as e:
-        logger.error(f"Error getting statistics: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
-
-if __name__ == '__main__':
-    print("Starting SME Firewall Manager API...")
-    print("Available endpoints:")
-    print("  GET  /api/firewalls - List all firewalls")
-    print("  POST /api/firewalls/deploy - Deploy new firewall")
-    print("  POST /api/firewalls/<id>/start - Start firewall")
-    print("  POST /api/firewalls/<id>/stop - Stop firewall")
-    print("  GET  /api/logs - Get system logs")
-    print("  GET  /api/statistics - Get statistics")
-    
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+from flask import Flask, request, jsonify
+from flask_cors import CORS
+from firewall_manager import FirewallManager, validate_config
+from config import Config
+import functools
+import hashlib
+import logging
+import os
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ensure database directory exists
+os.makedirs('database', exist_ok=True)
+
+app = Flask(__name__)
+CORS(app)
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """Serialize jsonify payloads with orjson's C encoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+# Initialize firewall manager
+firewall_mgr = FirewallManager()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# In-process response cache for the read-only endpoints. Entries expire
+# after their TTL, but a stale entry is served as a fallback (for up to
+# CACHE_STALE_BUFFER extra seconds) if refreshing it fails.
+CACHE_TTL_SHORT = 5    # seconds - statistics and logs change often
+CACHE_TTL_NORMAL = 30  # seconds - firewall list, invalidated on writes
+CACHE_STALE_BUFFER = 30
+
+_response_cache = {}
+
+def _conditional(response, etag, ttl):
+    """Answer with 304 Not Modified if the client already holds `etag`"""
+    if etag in request.if_none_match:
+        return app.response_class(status=304, headers={
+            'ETag': f'"{etag}"',
+            'Cache-Control': f'max-age={ttl}'
+        })
+    return response
+
+def cached(key, ttl):
+    """Cache a view's successful response under `key` for `ttl` seconds"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.time()
+            entry = _response_cache.get(key)
+            if entry and now - entry['ts'] < ttl:
+                return _conditional(entry['response'], entry['etag'], ttl)
+
+            response = fn(*args, **kwargs)
+            status = response[1] if isinstance(response, tuple) else response.status_code
+
+            if status == 200:
+                etag = hashlib.md5(response.get_data()).hexdigest()
+                response.set_etag(etag)
+                # Tell polling clients how long the representation stays fresh
+                response.headers['Cache-Control'] = f'max-age={ttl}'
+                _response_cache[key] = {'response': response, 'etag': etag, 'ts': now}
+                return _conditional(response, etag, ttl)
+            elif entry and now - entry['ts'] < ttl + CACHE_STALE_BUFFER:
+                # Refresh failed - serve the stale copy rather than the error
+                logger.warning("Serving stale cached response for: %s", key)
+                return _conditional(entry['response'], entry['etag'], ttl)
+
+            return response
+        return wrapper
+    return decorator
+
+def invalidate_cache(*keys):
+    """Drop cached responses after a write"""
+    for key in keys:
+        _response_cache.pop(key, None)
+
+@app.route('/')
+def health_check():
+    return jsonify({
+        "status": "SME Firewall Manager API is running",
+        "version": "1.0.0",
+        "technologies": ["OSM", "OpenFlow", "NETCONF", "REST API"]
+    })
+
+@app.route('/api/firewalls', methods=['GET'])
+@cached('firewalls', CACHE_TTL_NORMAL)
+def get_firewalls():
+    """Get all firewall instances"""
+    try:
+        firewalls = firewall_mgr.get_all_firewalls()
+        return jsonify({"success": True, "firewalls": firewalls})
+    except Exception as e:
+        logger.error("Error getting firewalls: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/stream', methods=['GET'])
+def stream_firewalls():
+    """Stream all firewalls as newline-delimited JSON"""
+    def generate():
+        for firewall in firewall_mgr.iter_firewalls():
+            yield app.json.dumps(firewall._asdict()) + "\n"
+
+    return app.response_class(generate(), mimetype='application/x-ndjson')
+
+@app.route('/api/firewalls/deploy', methods=['POST'])
+def deploy_firewall():
+    """Deploy a new firewall instance"""
+    try:
+        config = request.json
+
+        # Validate required fields
+        required_fields = ['name', 'management_ip', 'subnet', 'vcpu', 'ram', 'security_policy']
+        for field in required_fields:
+            if field not in config:
+                return jsonify({
+                    "success": False,
+                    "error": f"Missing required field: {field}"
+                }), 400
+
+        # Validate field types and policy before touching the manager
+        error = validate_config(config)
+        if error:
+            return jsonify({"success": False, "error": error}), 400
+
+        logger.info("Deploying firewall with config: %s", config)
+
+        # Deploy firewall
+        result = firewall_mgr.deploy_firewall(config)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error("Error deploying firewall: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/deploy/batch', methods=['POST'])
+def deploy_firewalls_batch():
+    """Deploy multiple firewall instances in one request"""
+    try:
+        configs = request.json
+        if not isinstance(configs, list) or not configs:
+            return jsonify({
+                "success": False,
+                "error": "Request body must be a non-empty list of firewall configs"
+            }), 400
+
+        # Validate every config before starting any deployment
+        required_fields = ['name', 'management_ip', 'subnet', 'vcpu', 'ram', 'security_policy']
+        for index, config in enumerate(configs):
+            for field in required_fields:
+                if field not in config:
+                    return jsonify({
+                        "success": False,
+                        "error": f"Config {index}: missing required field: {field}"
+                    }), 400
+            error = validate_config(config)
+            if error:
+                return jsonify({
+                    "success": False,
+                    "error": f"Config {index}: {error}"
+                }), 400
+
+        result = firewall_mgr.deploy_firewalls_batch(configs)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+
+    except Exception as e:
+        logger.error("Error in batch deployment: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/<firewall_id>/start', methods=['POST'])
+def start_firewall(firewall_id):
+    """Start a firewall instance"""
+    try:
+        result = firewall_mgr.start_firewall(firewall_id)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+    except Exception as e:
+        logger.error("Error starting firewall: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/<firewall_id>/stop', methods=['POST'])
+def stop_firewall(firewall_id):
+    """Stop a firewall instance"""
+    try:
+        result = firewall_mgr.stop_firewall(firewall_id)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+    except Exception as e:
+        logger.error("Error stopping firewall: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/<firewall_id>/configure', methods=['POST'])
+def configure_firewall(firewall_id):
+    """Configure firewall rules"""
+    try:
+        config = request.json
+        result = firewall_mgr.configure_firewall(firewall_id, config)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+    except Exception as e:
+        logger.error("Error configuring firewall: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/firewalls/<firewall_id>', methods=['DELETE'])
+def delete_firewall(firewall_id):
+    """Delete a firewall instance"""
+    try:
+        result = firewall_mgr.delete_firewall(firewall_id)
+        invalidate_cache('firewalls', 'statistics')
+        return jsonify(result)
+    except Exception as e:
+        logger.error("Error deleting firewall: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/logs', methods=['GET'])
+@cached('logs', CACHE_TTL_SHORT)
+def get_logs():
+    """Get system logs"""
+    try:
+        logs = firewall_mgr.get_system_logs()
+        return jsonify({"success": True, "logs": logs})
+    except Exception as e:
+        logger.error("Error getting logs: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/statistics', methods=['GET'])
+@cached('statistics', CACHE_TTL_SHORT)
+def get_statistics():
+    """Get system statistics"""
+    try:
+        stats = firewall_mgr.get_statistics()
+        return jsonify({"success": True, "statistics": stats})
+    except Exception as e:
+        logger.error("Error getting statistics: %s", e)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+if __name__ == '__main__':
+    print("Starting SME Firewall Manager API...")
+    print("Available endpoints:")
+    print("  GET  /api/firewalls - List all firewalls")
+    print("  POST /api/firewalls/deploy - Deploy new firewall")
+    print("  POST /api/firewalls/<id>/start - Start firewall")
+    print("  POST /api/firewalls/<id>/stop - Stop firewall")
+    print("  GET  /api/logs - Get system logs")
+    print("  GET  /api/statistics - Get statistics")
+
+    if Config.DEBUG:
+        # Flask's built-in server, reloader and debugger enabled
+        app.run(host=Config.HOST, port=Config.PORT, debug=True)
+    else:
+        # Production: threaded WSGI server with persistent connections
+        from waitress import serve
+        print(f"Serving with waitress on {Config.HOST}:{Config.PORT} ({Config.WSGI_THREADS} threads)")
+        serve(app, host=Config.HOST, port=Config.PORT, threads=Config.WSGI_THREADS)
\ No newline at end of file
@@ -20,6 +20,17 @@ class Config:
     
     # Database Configuration
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'database/firewalls.db')
+
+    # Simulation Configuration
+    # Set SIMULATE_DELAYS=false to skip the artificial OSM/OpenFlow/NETCONF
+    # latencies, e.g. when benchmarking or running against real backends
+    SIMULATE_DELAYS = os.getenv('SIMULATE_DELAYS', 'true').lower() == 'true'
     
     # Flask Configuration
-    SECRET_KEY = os.getenv('SECRET_KEY', 'sme-firewall-secret-key')
\ No newline at end of file
+    SECRET_KEY = os.getenv('SECRET_KEY', 'sme-firewall-secret-key')
+    HOST = os.getenv('HOST', '0.0.0.0')
+    PORT = int(os.getenv('PORT', '5000'))
+    DEBUG = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
+
+    # WSGI Server Configuration
+    WSGI_THREADS = int(os.getenv('WSGI_THREADS', '8'))
\ No newline at end of file
@@ -1,400 +1,628 @@
-import sqlite3
-import json
-import time
-from datetime import datetime
-import logging
-import requests
-from config import Config
-
-logger = logging.getLogger(__name__)
-
-class FirewallManager:
-    def __init__(self):
-        self.db_path = Config.DATABASE_PATH
-        self.init_database()
-        self.system_logs = []
-        self._add_log("INFO", "Firewall Manager initialized")
-
-    def init_database(self):
-        """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS firewalls (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                management_ip TEXT,
-                subnet TEXT,
-                vcpu INTEGER,
-                ram INTEGER,
-                security_policy TEXT,
-                status TEXT,
-                created_at TEXT,
-                technology_stack TEXT,
-                config_method TEXT
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-
-    def deploy_firewall(self, config):
-        """Deploy a new firewall instance using OSM+OpenFlow"""
-        firewall_id = f"fw-{int(time.time())}"
-        
-        try:
-            self._add_log("INFO", f"Starting deployment of firewall: {config['name']}")
-            
-            # Step 1: Simulate OSM VNF Deployment
-            self._add_log("INFO", "Step 1: Deploying VNF via OSM")
-            osm_result = self._deploy_via_osm(config)
-            
-            # Step 2: Simulate OpenFlow Configuration
-            self._add_log("INFO", "Step 2: Configuring OpenFlow rules")
-            openflow_result = self._configure_openflow(firewall_id, config)
-            
-            # Step 3: Simulate NETCONF Configuration
-            self._add_log("INFO", "Step 3: Configuring via NETCONF")
-            netconf_result = self._configure_via_netconf(config)
-            
-            # Save to database
-            self._save_firewall_to_db(firewall_id, config, "running")
-            
-            self._add_log("SUCCESS", f"Firewall {config['name']} deployed successfully")
-            
-            return {
-                "success": True,
-                "firewall_id": firewall_id,
-                "message": "Firewall deployed successfully",
-                "details": {
-                    "osm": osm_result,
-                    "openflow": openflow_result,
-                    "netconf": netconf_result,
-                    "technology_stack": "OSM + OpenFlow + NETCONF/REST"
-                }
-            }
-            
-        except Exception as e:
-            self._add_log("ERROR", f"Failed to deploy firewall: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-
-    def _deploy_via_osm(self, config):
-        """Simulate OSM VNF deployment"""
-        # In production, this would call OSM Northbound API
-        vnf_config = {
-            "vnfd_id": "firewall-vnfd",
-            "vnf_name": config['name'],
-            "vim_account": "sme-vim",
-            "config": {
-                "vcpu": config['vcpu'],
-                "ram": config['ram'],
-                "interfaces": 2
-            }
-        }
-        
-        # Simulate API call delay
-        time.sleep(1)
-        
-        return {
-            "status": "deployed",
-            "vnf_id": f"vnf-{config['name']}",
-            "ns_id": f"ns-{config['name']}",
-            "message": "VNF instantiated successfully via OSM"
-        }
-
-    def _configure_openflow(self, firewall_id, config):
-        """Simulate OpenFlow configuration"""
-        # Generate flow rules based on security policy
-        flow_rules = self._generate_flow_rules(config['subnet'], config['security_policy'])
-        
-        # In production, this would send to OpenFlow controller
-        openflow_config = {
-            "firewall_id": firewall_id,
-            "subnet": config['subnet'],
-            "policy": config['security_policy'],
-            "flow_rules": flow_rules
-        }
-        
-        time.sleep(0.5)
-        
-        return {
-            "status": "configured",
-            "rules_installed": len(flow_rules),
-            "controller": Config.OPENFLOW_CONTROLLER
-        }
-
-    def _configure_via_netconf(self, config):
-        """Simulate NETCONF configuration"""
-        # In production, this would use ncclient to establish NETCONF session
-        netconf_config = {
-            "target": config['management_ip'],
-            "port": Config.NETCONF_PORT,
-            "username": Config.NETCONF_USERNAME,
-            "config": {
-                "security_policy": config['security_policy'],
-                "interfaces": [
-                    {"name": "eth0", "zone": "untrusted"},
-                    {"name": "eth1", "zone": "trusted"}
-                ]
-            }
-        }
-        
-        time.sleep(0.5)
-        
-        return {
-            "status": "configured",
-            "method": "NETCONF",
-            "session_established": True
-        }
-
-    def _generate_flow_rules(self, subnet, policy):
-        """Generate OpenFlow rules based on security policy"""
-        rules = []
-        
-        if policy == "default":
-            rules = [
-                {"priority": 100, "action": "drop", "match": {"ipv4_src": subnet, "ip_proto": "any"}},
-                {"priority": 100, "action": "drop", "match": {"ipv4_dst": subnet, "ip_proto": "any"}}
-            ]
-        elif policy == "web":
-            rules = [
-                {"priority": 200, "action": "allow", "match": {"tcp_dst": 80}},
-                {"priority": 200, "action": "allow", "match": {"tcp_dst": 443}},
-                {"priority": 100, "action": "drop", "match": {"ipv4_src": subnet, "ip_proto": "any"}}
-            ]
-        elif policy == "database":
-            rules = [
-                {"priority": 200, "action": "allow", "match": {"tcp_dst": 3306}},
-                {"priority": 200, "action": "allow", "match": {"tcp_dst": 5432}},
-                {"priority": 100, "action": "drop", "match": {"ipv4_src": subnet, "ip_proto": "any"}}
-            ]
-        
-        return rules
-
-    def start_firewall(self, firewall_id):
-        """Start a firewall instance"""
-        try:
-            firewall = self._get_firewall(firewall_id)
-            if not firewall:
-                return {"success": False, "error": "Firewall not found"}
-            
-            self._add_log("INFO", f"Starting firewall: {firewall['name']}")
-            
-            # Simulate OSM operation
-            time.sleep(1)
-            
-            # Update status in database
-            self._update_firewall_status(firewall_id, "running")
-            
-            self._add_log("SUCCESS", f"Firewall {firewall['name']} started successfully")
-            
-            return {"success": True, "message": "Firewall started successfully"}
-            
-        except Exception as e:
-            self._add_log("ERROR", f"Failed to start firewall: {str(e)}")
-            return {"success": False, "error": str(e)}
-
-    def stop_firewall(self, firewall_id):
-        """Stop a firewall instance"""
-        try:
-            firewall = self._get_firewall(firewall_id)
-            if not firewall:
-                return {"success": False, "error": "Firewall not found"}
-            
-            self._add_log("INFO", f"Stopping firewall: {firewall['name']}")
-            
-            # Simulate OSM operation
-            time.sleep(1)
-            
-            # Update status in database
-            self._update_firewall_status(firewall_id, "stopped")
-            
-            self._add_log("SUCCESS", f"Firewall {firewall['name']} stopped successfully")
-            
-            return {"success": True, "message": "Firewall stopped successfully"}
-            
-        except Exception as e:
-            self._add_log("ERROR", f"Failed to stop firewall: {str(e)}")
-            return {"success": False, "error": str(e)}
-
-    def configure_firewall(self, firewall_id, config):
-        """Configure firewall rules"""
-        try:
-            firewall = self._get_firewall(firewall_id)
-            if not firewall:
-                return {"success": False, "error": "Firewall not found"}
-            
-            self._add_log("INFO", f"Configuring firewall: {firewall['name']}")
-            
-            # Update configuration
-            if 'security_policy' in config:
-                self._update_firewall_policy(firewall_id, config['security_policy'])
-                self._add_log("INFO", f"Updated security policy to: {config['security_policy']}")
-            
-            self._add_log("SUCCESS", f"Firewall {firewall['name']} configured successfully")
-            
-            return {"success": True, "message": "Firewall configured successfully"}
-            
-        except Exception as e:
-            self._add_log("ERROR", f"Failed to configure firewall: {str(e)}")
-            return {"success": False, "error": str(e)}
-
-    def delete_firewall(self, firewall_id):
-        """Delete a firewall instance"""
-        try:
-            firewall = self._get_firewall(firewall_id)
-            if not firewall:
-                return {"success": False, "error": "Firewall not found"}
-            
-            self._add_log("INFO", f"Deleting firewall: {firewall['name']}")
-            
-            # Simulate OSM deletion
-            time.sleep(1)
-            
-            # Remove from database
-            self._delete_firewall_from_db(firewall_id)
-            
-            self._add_log("SUCCESS", f"Firewall {firewall['name']} deleted successfully")
-            
-            return {"success": True, "message": "Firewall deleted successfully"}
-            
-        except Exception as e:
-            self._add_log("ERROR", f"Failed to delete firewall: {str(e)}")
-            return {"success": False, "error": str(e)}
-
-    def get_all_firewalls(self):
-        """Get all firewall instances"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM firewalls ORDER BY created_at DESC')
-        rows = cursor.fetchall()
-        
-        firewalls = []
-        for row in rows:
-            firewalls.append({
-                "id": row[0],
-                "name": row[1],
-                "management_ip": row[2],
-                "subnet": row[3],
-                "vcpu": row[4],
-                "ram": row[5],
-                "security_policy": row[6],
-                "status": row[7],
-                "created_at": row[8],
-                "technology_stack": row[9],
-                "config_method": row[10]
-            })
-        
-        conn.close()
-        return firewalls
-
-    def get_system_logs(self):
-        """Get system logs"""
-        return self.system_logs[-50:]  # Return last 50 logs
-
-    def get_statistics(self):
-        """Get system statistics"""
-        firewalls = self.get_all_firewalls()
-        
-        running = len([fw for fw in firewalls if fw['status'] == 'running'])
-        stopped = len([fw for fw in firewalls if fw['status'] == 'stopped'])
-        total = len(firewalls)
-        
-        return {
-            "total_firewalls": total,
-            "running_firewalls": running,
-            "stopped_firewalls": stopped,
-            "system_uptime": "99.8%",
-            "total_logs": len(self.system_logs)
-        }
-
-    def _save_firewall_to_db(self, firewall_id, config, status):
-        """Save firewall to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO firewalls 
-            (id, name, management_ip, subnet, vcpu, ram, security_policy, status, created_at, technology_stack, config_method)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            firewall_id,
-            config['name'],
-            config.get('management_ip', ''),
-            config.get('subnet', ''),
-            config.get('vcpu', 1),
-            config.get('ram', 2),
-            config.get('security_policy', 'default'),
-            status,
-            datetime.now().isoformat(),
-            "OSM+OpenFlow+NETCONF",
-            config.get('config_method', 'netconf')
-        ))
-        
-        conn.commit()
-        conn.close()
-
-    def _get_firewall(self, firewall_id):
-        """Get firewall from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM firewalls WHERE id = ?', (firewall_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
-        
-        if row:
-            return {
-                "id": row[0],
-                "name": row[1],
-                "management_ip": row[2],
-                "subnet": row[3],
-                "vcpu": row[4],
-                "ram": row[5],
-                "security_policy": row[6],
-                "status": row[7],
-                "created_at": row[8],
-                "technology_stack": row[9],
-                "config_method": row[10]
-            }
-        return None
-
-    def _update_firewall_status(self, firewall_id, status):
-        """Update firewall status in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('UPDATE firewalls SET status = ? WHERE id = ?', (status, firewall_id))
-        conn.commit()
-        conn.close()
-
-    def _update_firewall_policy(self, firewall_id, policy):
-        """Update firewall policy in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('UPDATE firewalls SET security_policy = ? WHERE id = ?', (policy, firewall_id))
-        conn.commit()
-        conn.close()
-
-    def _delete_firewall_from_db(self, firewall_id):
-        """Delete firewall from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM firewalls WHERE id = ?', (firewall_id,))
-        conn.commit()
-        conn.close()
-
-    def _add_log(self, level, message):
-        """Add system log"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{level}] {timestamp} - {message}"
-        self.system_logs.append(log_entry)
-        logger.info(log_entry)
\ No newline at end of file
+import collections
+import functools
+import itertools
+import sqlite3
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+import requests
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Number of pooled reader connections kept open per manager instance
+POOL_SIZE = 8
+
+# Maximum number of system log entries kept in memory
+LOG_HISTORY = 500
+
+# Maximum number of firewall rows held in the in-memory index
+FW_CACHE_SIZE = 1024
+
+# Bump when the DDL in init_database changes; recorded in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Shared SQL text. Passing the identical string object to conn.execute lets
+# sqlite3's per-connection statement cache reuse the compiled statement
+# instead of re-parsing the SQL on every call.
+_SQL_INSERT_FIREWALL = '''
+    INSERT INTO firewalls
+    (id, name, management_ip, subnet, vcpu, ram, security_policy, status, created_at, technology_stack, config_method)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_SELECT_ALL_FIREWALLS = 'SELECT * FROM firewalls ORDER BY created_at DESC'
+_SQL_SELECT_FIREWALL = 'SELECT * FROM firewalls WHERE id = ?'
+_SQL_DELETE_FIREWALL = 'DELETE FROM firewalls WHERE id = ?'
+_SQL_STATUS_COUNTS = 'SELECT status, COUNT(*) FROM firewalls GROUP BY status'
+
+# Columns _update_firewall is allowed to set; everything else is immutable
+# once the row is created
+_UPDATABLE_COLUMNS = frozenset({'status', 'security_policy'})
+
+# Lightweight row type for firewalls read from the database. Field order
+# matches the firewalls table; internal code uses attribute access and only
+# the API boundary converts to dicts via _asdict().
+Firewall = collections.namedtuple('Firewall', [
+    'id', 'name', 'management_ip', 'subnet', 'vcpu', 'ram',
+    'security_policy', 'status', 'created_at', 'technology_stack', 'config_method'
+])
+
+# Flow-rule templates per security policy, built once at import time.
+# Rules that need the firewall's subnet spliced in carry a '_needs_subnet'
+# marker naming the match field to fill.
+_POLICY_TEMPLATES = {
+    "default": (
+        {"priority": 100, "action": "drop", "match": {"ip_proto": "any"}, "_needs_subnet": "ipv4_src"},
+        {"priority": 100, "action": "drop", "match": {"ip_proto": "any"}, "_needs_subnet": "ipv4_dst"},
+    ),
+    "web": (
+        {"priority": 200, "action": "allow", "match": {"tcp_dst": 80}},
+        {"priority": 200, "action": "allow", "match": {"tcp_dst": 443}},
+        {"priority": 100, "action": "drop", "match": {"ip_proto": "any"}, "_needs_subnet": "ipv4_src"},
+    ),
+    "database": (
+        {"priority": 200, "action": "allow", "match": {"tcp_dst": 3306}},
+        {"priority": 200, "action": "allow", "match": {"tcp_dst": 5432}},
+        {"priority": 100, "action": "drop", "match": {"ip_proto": "any"}, "_needs_subnet": "ipv4_src"},
+    ),
+}
+
+def validate_config(config):
+    """Validate a deploy config; returns an error string or None"""
+    name = config.get('name')
+    if not isinstance(name, str) or not name.strip():
+        return "Firewall name must be a non-empty string"
+
+    for field in ('vcpu', 'ram'):
+        value = config.get(field)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+            return f"Field '{field}' must be a positive integer"
+
+    policy = config.get('security_policy', 'default')
+    if policy not in _POLICY_TEMPLATES:
+        return f"Unknown security policy: {policy}"
+
+    return None
+
+@functools.lru_cache(maxsize=32)
+def _rules_for(policy, subnet):
+    """Expand the template for `policy`, filling in `subnet` where marked"""
+    rules = []
+    for template in _POLICY_TEMPLATES.get(policy, ()):
+        if "_needs_subnet" in template:
+            rule = {k: v for k, v in template.items() if k != "_needs_subnet"}
+            rule["match"] = {template["_needs_subnet"]: subnet, **template["match"]}
+            rules.append(rule)
+        else:
+            rules.append(template)
+    return rules
+
+class FirewallManager:
+    def __init__(self):
+        self.db_path = Config.DATABASE_PATH
+
+        # Persistent connection pool: one dedicated writer guarded by a lock,
+        # plus a bounded queue of readers. Avoids reopening the database file
+        # (and re-running pragmas) on every request.
+        self._write_lock = threading.Lock()
+        self._writer = self._create_connection()
+        self._pool = queue.Queue(maxsize=POOL_SIZE)
+        for _ in range(POOL_SIZE):
+            self._pool.put(self._create_connection())
+
+        # Shared worker pool for running provisioning steps concurrently
+        self._executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+
+        # Shared HTTP session for OSM/OpenFlow REST calls: keep-alive reuses
+        # TCP connections instead of paying a handshake per request
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=2)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+
+        self.init_database()
+        # Bounded log buffer: old entries fall off instead of growing forever
+        self.system_logs = collections.deque(maxlen=LOG_HISTORY)
+        # Timestamp cache for _add_log: reformat at most once per second
+        self._ts_second = 0
+        self._ts_string = ""
+        # Per-process counter so ids minted within the same second stay unique
+        self._id_counter = itertools.count()
+        # In-memory LRU index of Firewall rows by id, kept in sync by the
+        # write helpers so _get_firewall usually skips the SQLite round-trip.
+        # Bounded at FW_CACHE_SIZE entries; least-recently-used rows are
+        # evicted and simply fall back to a database read.
+        self._fw_cache = collections.OrderedDict()
+        self._fw_cache_lock = threading.Lock()
+        self._add_log("INFO", "Firewall Manager initialized")
+
+    def _create_connection(self):
+        """Open a SQLite connection tuned for concurrent access"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=64)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-8000')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=134217728')
+        return conn
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a reader connection from the pool"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _write_conn(self):
+        """Acquire the single writer connection"""
+        with self._write_lock:
+            yield self._writer
+
+    @contextmanager
+    def _transaction(self):
+        """Writer connection wrapped in one explicit BEGIN ... COMMIT"""
+        with self._write_conn() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            else:
+                conn.execute('COMMIT')
+
+    def init_database(self):
+        """Run the schema migration once; later instances skip the DDL"""
+        with self._write_conn() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS firewalls (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    management_ip TEXT,
+                    subnet TEXT,
+                    vcpu INTEGER,
+                    ram INTEGER,
+                    security_policy TEXT,
+                    status TEXT,
+                    created_at TEXT,
+                    technology_stack TEXT,
+                    config_method TEXT
+                )
+            ''')
+
+            # Keeps the status aggregation in get_statistics index-only
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fw_status ON firewalls(status)')
+
+            # Lets the ORDER BY created_at DESC in list queries walk the
+            # index instead of sorting (schema version 2)
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fw_created_at ON firewalls(created_at DESC)')
+
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+
+    def _next_firewall_id(self):
+        """Allocate a unique firewall id"""
+        return f"fw-{int(time.time())}-{next(self._id_counter)}"
+
+    def deploy_firewall(self, config):
+        """Deploy a new firewall instance using OSM+OpenFlow"""
+        # Reject bad configs before any OSM/OpenFlow/NETCONF round-trip
+        error = validate_config(config)
+        if error:
+            self._add_log("ERROR", "Rejected deployment request: %s", error)
+            return {"success": False, "error": error}
+
+        firewall_id = self._next_firewall_id()
+
+        try:
+            self._add_log("INFO", "Starting deployment of firewall: %s", config['name'])
+
+            # The OSM, OpenFlow and NETCONF steps are independent of each
+            # other, so run them concurrently instead of back to back
+            self._add_log("INFO", "Provisioning via OSM, OpenFlow and NETCONF in parallel")
+            osm_future = self._executor.submit(self._deploy_via_osm, config)
+            openflow_future = self._executor.submit(self._configure_openflow, firewall_id, config)
+            netconf_future = self._executor.submit(self._configure_via_netconf, config)
+
+            osm_result = osm_future.result()
+            openflow_result = openflow_future.result()
+            netconf_result = netconf_future.result()
+
+            # Save to database
+            self._save_firewall_to_db(firewall_id, config, "running")
+            
+            self._add_log("SUCCESS", "Firewall %s deployed successfully", config['name'])
+            
+            return {
+                "success": True,
+                "firewall_id": firewall_id,
+                "message": "Firewall deployed successfully",
+                "details": {
+                    "osm": osm_result,
+                    "openflow": openflow_result,
+                    "netconf": netconf_result,
+                    "technology_stack": "OSM + OpenFlow + NETCONF/REST"
+                }
+            }
+            
+        except Exception as e:
+            self._add_log("ERROR", "Failed to deploy firewall: %s", str(e))
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def deploy_firewalls_batch(self, configs):
+        """Deploy multiple firewall instances in one batch"""
+        # Validate the whole batch before starting any deployment
+        for index, config in enumerate(configs):
+            error = validate_config(config)
+            if error:
+                self._add_log("ERROR", "Rejected batch deployment request: config %d: %s", index, error)
+                return {
+                    "success": False,
+                    "error": f"Config {index}: {error}",
+                    "deployed": 0,
+                    "failed": len(configs)
+                }
+
+        firewall_ids = [self._next_firewall_id() for _ in configs]
+
+        self._add_log("INFO", "Starting batch deployment of %d firewalls", len(configs))
+
+        def _provision(firewall_id, config):
+            try:
+                osm_result = self._deploy_via_osm(config)
+                openflow_result = self._configure_openflow(firewall_id, config)
+                netconf_result = self._configure_via_netconf(config)
+                return {
+                    "success": True,
+                    "firewall_id": firewall_id,
+                    "name": config['name'],
+                    "details": {
+                        "osm": osm_result,
+                        "openflow": openflow_result,
+                        "netconf": netconf_result,
+                        "technology_stack": "OSM + OpenFlow + NETCONF/REST"
+                    }
+                }
+            except Exception as e:
+                self._add_log("ERROR", "Failed to deploy firewall %s: %s", config.get('name'), str(e))
+                return {"success": False, "name": config.get('name'), "error": str(e)}
+
+        # Provision all firewalls concurrently instead of paying the
+        # OSM/OpenFlow/NETCONF round-trips serially per firewall
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_provision, firewall_ids, configs))
+
+        # Persist all successful deployments in one transaction
+        rows = [
+            self._firewall_row(result['firewall_id'], config, "running")
+            for result, config in zip(results, configs)
+            if result['success']
+        ]
+        if rows:
+            with self._transaction() as conn:
+                conn.executemany(_SQL_INSERT_FIREWALL, rows)
+            for row in rows:
+                self._cache_firewall(Firewall._make(row))
+
+        deployed = len(rows)
+        self._add_log("SUCCESS", "Batch deployment finished: %d/%d firewalls deployed", deployed, len(configs))
+
+        return {
+            "success": deployed == len(configs),
+            "deployed": deployed,
+            "failed": len(configs) - deployed,
+            "results": results
+        }
+
+    def _deploy_via_osm(self, config):
+        """Simulate OSM VNF deployment"""
+        # In production, this would POST to the OSM Northbound API via self._http
+        vnf_config = {
+            "vnfd_id": "firewall-vnfd",
+            "vnf_name": config['name'],
+            "vim_account": "sme-vim",
+            "config": {
+                "vcpu": config['vcpu'],
+                "ram": config['ram'],
+                "interfaces": 2
+            }
+        }
+        
+        # Simulate API call delay
+        self._simulate_delay(1)
+        
+        return {
+            "status": "deployed",
+            "vnf_id": f"vnf-{config['name']}",
+            "ns_id": f"ns-{config['name']}",
+            "message": "VNF instantiated successfully via OSM"
+        }
+
+    def _configure_openflow(self, firewall_id, config):
+        """Simulate OpenFlow configuration"""
+        # Generate flow rules based on security policy
+        flow_rules = self._generate_flow_rules(config['subnet'], config['security_policy'])
+        
+        # In production, this would be sent to the OpenFlow controller via self._http
+        openflow_config = {
+            "firewall_id": firewall_id,
+            "subnet": config['subnet'],
+            "policy": config['security_policy'],
+            "flow_rules": flow_rules
+        }
+        
+        self._simulate_delay(0.5)
+        
+        return {
+            "status": "configured",
+            "rules_installed": len(flow_rules),
+            "controller": Config.OPENFLOW_CONTROLLER
+        }
+
+    def _configure_via_netconf(self, config):
+        """Simulate NETCONF configuration"""
+        # In production, this would use ncclient to establish NETCONF session
+        netconf_config = {
+            "target": config['management_ip'],
+            "port": Config.NETCONF_PORT,
+            "username": Config.NETCONF_USERNAME,
+            "config": {
+                "security_policy": config['security_policy'],
+                "interfaces": [
+                    {"name": "eth0", "zone": "untrusted"},
+                    {"name": "eth1", "zone": "trusted"}
+                ]
+            }
+        }
+        
+        self._simulate_delay(0.5)
+        
+        return {
+            "status": "configured",
+            "method": "NETCONF",
+            "session_established": True
+        }
+
+    def _generate_flow_rules(self, subnet, policy):
+        """Generate OpenFlow rules based on security policy"""
+        return _rules_for(policy, subnet)
+
+    def start_firewall(self, firewall_id):
+        """Start a firewall instance"""
+        try:
+            firewall = self._get_firewall(firewall_id)
+            if not firewall:
+                return {"success": False, "error": "Firewall not found"}
+            
+            self._add_log("INFO", "Starting firewall: %s", firewall.name)
+            
+            # Simulate OSM operation
+            self._simulate_delay(1)
+            
+            # Update status in database
+            self._update_firewall(firewall_id, status='running')
+            
+            self._add_log("SUCCESS", "Firewall %s started successfully", firewall.name)
+            
+            return {"success": True, "message": "Firewall started successfully"}
+            
+        except Exception as e:
+            self._add_log("ERROR", "Failed to start firewall: %s", str(e))
+            return {"success": False, "error": str(e)}
+
+    def stop_firewall(self, firewall_id):
+        """Stop a firewall instance"""
+        try:
+            firewall = self._get_firewall(firewall_id)
+            if not firewall:
+                return {"success": False, "error": "Firewall not found"}
+            
+            self._add_log("INFO", "Stopping firewall: %s", firewall.name)
+            
+            # Simulate OSM operation
+            self._simulate_delay(1)
+            
+            # Update status in database
+            self._update_firewall(firewall_id, status='stopped')
+            
+            self._add_log("SUCCESS", "Firewall %s stopped successfully", firewall.name)
+            
+            return {"success": True, "message": "Firewall stopped successfully"}
+            
+        except Exception as e:
+            self._add_log("ERROR", "Failed to stop firewall: %s", str(e))
+            return {"success": False, "error": str(e)}
+
+    def configure_firewall(self, firewall_id, config):
+        """Configure firewall rules"""
+        try:
+            firewall = self._get_firewall(firewall_id)
+            if not firewall:
+                return {"success": False, "error": "Firewall not found"}
+            
+            self._add_log("INFO", "Configuring firewall: %s", firewall.name)
+            
+            # Update configuration
+            if 'security_policy' in config:
+                self._update_firewall(firewall_id, security_policy=config['security_policy'])
+                self._add_log("INFO", "Updated security policy to: %s", config['security_policy'])
+            
+            self._add_log("SUCCESS", "Firewall %s configured successfully", firewall.name)
+            
+            return {"success": True, "message": "Firewall configured successfully"}
+            
+        except Exception as e:
+            self._add_log("ERROR", "Failed to configure firewall: %s", str(e))
+            return {"success": False, "error": str(e)}
+
+    def delete_firewall(self, firewall_id):
+        """Delete a firewall instance"""
+        try:
+            firewall = self._get_firewall(firewall_id)
+            if not firewall:
+                return {"success": False, "error": "Firewall not found"}
+            
+            self._add_log("INFO", "Deleting firewall: %s", firewall.name)
+            
+            # Simulate OSM deletion
+            self._simulate_delay(1)
+            
+            # Remove from database
+            self._delete_firewall_from_db(firewall_id)
+            
+            self._add_log("SUCCESS", "Firewall %s deleted successfully", firewall.name)
+            
+            return {"success": True, "message": "Firewall deleted successfully"}
+            
+        except Exception as e:
+            self._add_log("ERROR", "Failed to delete firewall: %s", str(e))
+            return {"success": False, "error": str(e)}
+
+    def iter_firewalls(self):
+        """Yield Firewall rows one at a time, newest first"""
+        with self._read_conn() as conn:
+            for row in conn.execute(_SQL_SELECT_ALL_FIREWALLS):
+                yield Firewall._make(row)
+
+    def get_all_firewalls(self):
+        """Get all firewall instances as dicts for the API layer"""
+        return [fw._asdict() for fw in self.iter_firewalls()]
+
+    def get_system_logs(self):
+        """Get the last 50 system logs, formatted on demand"""
+        recent = list(self.system_logs)[-50:]
+        return [
+            f"[{level}] {timestamp} - {message % args if args else message}"
+            for level, timestamp, message, args in recent
+        ]
+
+    def get_statistics(self):
+        """Get system statistics"""
+        # Aggregate in SQLite instead of fetching every row and counting in Python
+        with self._read_conn() as conn:
+            rows = conn.execute(_SQL_STATUS_COUNTS).fetchall()
+
+        counts = dict(rows)
+        total = sum(counts.values())
+        running = counts.get('running', 0)
+        stopped = counts.get('stopped', 0)
+
+        return {
+            "total_firewalls": total,
+            "running_firewalls": running,
+            "stopped_firewalls": stopped,
+            "system_uptime": "99.8%",
+            "total_logs": len(self.system_logs)
+        }
+
+    def _firewall_row(self, firewall_id, config, status):
+        """Build the parameter tuple for an INSERT into firewalls"""
+        return (
+            firewall_id,
+            config['name'],
+            config.get('management_ip', ''),
+            config.get('subnet', ''),
+            config.get('vcpu', 1),
+            config.get('ram', 2),
+            config.get('security_policy', 'default'),
+            status,
+            datetime.now().isoformat(),
+            "OSM+OpenFlow+NETCONF",
+            config.get('config_method', 'netconf')
+        )
+
+    def _save_firewall_to_db(self, firewall_id, config, status):
+        """Save firewall to database"""
+        row = self._firewall_row(firewall_id, config, status)
+        with self._transaction() as conn:
+            conn.execute(_SQL_INSERT_FIREWALL, row)
+        self._cache_firewall(Firewall._make(row))
+
+    def _cache_firewall(self, firewall):
+        """Insert or refresh a row in the in-memory index, evicting the LRU"""
+        with self._fw_cache_lock:
+            self._fw_cache[firewall.id] = firewall
+            self._fw_cache.move_to_end(firewall.id)
+            while len(self._fw_cache) > FW_CACHE_SIZE:
+                self._fw_cache.popitem(last=False)
+
+    def _get_firewall(self, firewall_id):
+        """Get firewall, served from the in-memory index when possible"""
+        with self._fw_cache_lock:
+            firewall = self._fw_cache.get(firewall_id)
+            if firewall is not None:
+                self._fw_cache.move_to_end(firewall_id)
+        if firewall is not None:
+            return firewall
+
+        with self._read_conn() as conn:
+            row = conn.execute(_SQL_SELECT_FIREWALL, (firewall_id,)).fetchone()
+
+        if row is None:
+            return None
+
+        firewall = Firewall._make(row)
+        self._cache_firewall(firewall)
+        return firewall
+
+    def _update_firewall(self, firewall_id, **fields):
+        """Update whitelisted columns on a firewall row"""
+        invalid = set(fields) - _UPDATABLE_COLUMNS
+        if invalid:
+            raise ValueError(f"Cannot update column(s): {', '.join(sorted(invalid))}")
+
+        columns = sorted(fields)
+        assignments = ', '.join(f'{column} = ?' for column in columns)
+        values = [fields[column] for column in columns]
+
+        with self._transaction() as conn:
+            conn.execute(f'UPDATE firewalls SET {assignments} WHERE id = ?', (*values, firewall_id))
+        with self._fw_cache_lock:
+            cached = self._fw_cache.get(firewall_id)
+            if cached:
+                self._fw_cache[firewall_id] = cached._replace(**fields)
+
+    def _delete_firewall_from_db(self, firewall_id):
+        """Delete firewall from database"""
+        with self._transaction() as conn:
+            conn.execute(_SQL_DELETE_FIREWALL, (firewall_id,))
+        with self._fw_cache_lock:
+            self._fw_cache.pop(firewall_id, None)
+
+    def _simulate_delay(self, seconds):
+        """Mimic an external API round-trip; disabled via SIMULATE_DELAYS=false"""
+        if Config.SIMULATE_DELAYS:
+            time.sleep(seconds)
+
+    def _timestamp(self):
+        """Current time as 'YYYY-mm-dd HH:MM:SS', cached per second"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_string = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._ts_second = now
+        return self._ts_string
+
+    def _add_log(self, level, message, *args):
+        """Record a system log; `message % args` is rendered only when read"""
+        self.system_logs.append((level, self._timestamp(), message, args))
+        logger.info("[%s] " + message, level, *args)
\ No newline at end of file